@@ -17,10 +17,12 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import json
 import logging
-import os
 from contextlib import suppress
+from pathlib import Path
+from types import SimpleNamespace
 from unittest import mock
 from unittest.mock import ANY, MagicMock
 
@@ -29,6 +31,7 @@ import pytest
 from google.cloud.bigquery import DEFAULT_RETRY, ScalarQueryParameter, Table
 from google.cloud.exceptions import Conflict
 
+from airflow import DAG
 from airflow.exceptions import (
     AirflowException,
     AirflowSkipException,
@@ -47,7 +50,9 @@ from airflow.providers.common.compat.openlineage.facet import (
     SchemaDatasetFacetFields,
     SQLJobFacet,
 )
+from airflow.providers.google.cloud.hooks import bigquery as bigquery_hooks
 from airflow.providers.google.cloud.openlineage.utils import BIGQUERY_NAMESPACE
+from airflow.providers.google.cloud.operators import bigquery as bigquery_operators
 from airflow.providers.google.cloud.operators.bigquery import (
     BigQueryCheckOperator,
     BigQueryColumnCheckOperator,
@@ -102,20 +107,64 @@ MATERIALIZED_VIEW_DEFINITION = {
     "enableRefresh": True,
     "refreshIntervalMs": 2000000,
 }
+TEST_TABLE_REFERENCE = {
+    "tableId": TEST_TABLE_ID,
+    "projectId": TEST_GCP_PROJECT_ID,
+    "datasetId": TEST_DATASET,
+}
+VIEW_TABLE_RESOURCE = {
+    "tableReference": TEST_TABLE_REFERENCE,
+    "view": VIEW_DEFINITION,
+}
+MATERIALIZED_VIEW_TABLE_RESOURCE = {
+    "tableReference": TEST_TABLE_REFERENCE,
+    "materializedView": MATERIALIZED_VIEW_DEFINITION,
+}
+CLUSTERED_TABLE_RESOURCE = {
+    "tableReference": TEST_TABLE_REFERENCE,
+    "schema": [
+        {"name": "emp_name", "type": "STRING", "mode": "REQUIRED"},
+        {"name": "date_hired", "type": "DATE", "mode": "REQUIRED"},
+        {"name": "date_birth", "type": "DATE", "mode": "NULLABLE"},
+    ],
+    "timePartitioning": {"type": "DAY", "field": "date_hired"},
+    "clusterFields": ["date_birth"],
+}
+TABLE_RESOURCE_WITH_SCHEMA = {
+    "tableReference": TEST_TABLE_REFERENCE,
+    "description": "Table description.",
+    "schema": {
+        "fields": [
+            {"name": "field1", "type": "STRING", "description": "field1 description"},
+            {"name": "field2", "type": "INTEGER"},
+        ]
+    },
+}
 TEST_TABLE = "test-table"
 GCP_CONN_ID = "google_cloud_default"
 TEST_JOB_ID_1 = "test-job-id"
 TEST_JOB_ID_2 = "test-123"
 TEST_FULL_JOB_ID = f"{TEST_GCP_PROJECT_ID}:{TEST_DATASET_LOCATION}:{TEST_JOB_ID_1}"
 TEST_FULL_JOB_ID_2 = f"{TEST_GCP_PROJECT_ID}:{TEST_DATASET_LOCATION}:{TEST_JOB_ID_2}"
+TEST_INSERT_JOB_ID = "123456"
+TEST_REAL_JOB_ID = f"{TEST_INSERT_JOB_ID}_hash"
+TEST_QUERY_CONFIGURATION = {"query": {"query": "SELECT * FROM any", "useLegacySql": False}}
+QUERY_JOB_DETAILS = json.loads((Path(__file__).parent / "../utils/query_job_details.json").read_text())
+EXPECTED_SCHEMA_FACET = SchemaDatasetFacet(
+    fields=[
+        SchemaDatasetFacetFields(name="field1", type="STRING", description="field1 description"),
+        SchemaDatasetFacetFields(name="field2", type="INTEGER"),
+    ]
+)
+EXPECTED_DOCUMENTATION_FACET = DocumentationDatasetFacet(description="Table description.")
 
 
-def create_bigquery_job(errors=None, error_result=None, state="DONE"):
+def create_bigquery_job(job_id="mock-job-id", errors=None, error_result=None, state="DONE"):
     mock_job = MagicMock()
     mock_job.errors = errors or []
     mock_job.error_result = error_result
     mock_job.state = state
-    mock_job.job_id = "mock-job-id"
+    mock_job.job_id = job_id
     return mock_job
 
 
@@ -123,9 +172,44 @@ def assert_warning(msg: str, warnings):
     assert any(msg in str(w) for w in warnings)
 
 
+def assert_create_table_called(mock_hook, table_resource):
+    mock_hook.return_value.create_table.assert_called_once_with(
+        dataset_id=TEST_DATASET,
+        project_id=TEST_GCP_PROJECT_ID,
+        table_id=TEST_TABLE_ID,
+        table_resource=table_resource,
+        exists_ok=False,
+        schema_fields=None,
+        location=None,
+        timeout=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def _mock_context_template():
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_context(_mock_context_template):
+    yield _mock_context_template
+    _mock_context_template.reset_mock()
+
+
+@pytest.fixture
+def mock_hook():
+    with mock.patch.object(bigquery_operators, "BigQueryHook") as hook:
+        yield hook
+
+
+@pytest.fixture
+def mock_job():
+    with mock.patch.object(bigquery_hooks, "BigQueryJob") as job:
+        yield job
+
+
 class TestBigQueryCreateTableOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
+    def test_execute(self, mock_hook, mock_context):
         operator = BigQueryCreateTableOperator(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
@@ -134,108 +218,45 @@ class TestBigQueryCreateTableOperator:
             table_resource={},
         )
 
-        operator.execute(context=MagicMock())
+        operator.execute(context=mock_context)
 
-        mock_hook.return_value.create_table.assert_called_once_with(
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            table_id=TEST_TABLE_ID,
-            table_resource={},
-            exists_ok=False,
-            schema_fields=None,
-            location=None,
-            timeout=None,
-        )
+        assert_create_table_called(mock_hook, table_resource={})
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_create_view(self, mock_hook):
-        body = {
-            "tableReference": {
-                "tableId": TEST_TABLE_ID,
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-            },
-            "view": VIEW_DEFINITION,
-        }
+    def test_create_view(self, mock_hook, mock_context):
         operator = BigQueryCreateTableOperator(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
             project_id=TEST_GCP_PROJECT_ID,
             table_id=TEST_TABLE_ID,
-            table_resource=body,
+            table_resource=VIEW_TABLE_RESOURCE,
         )
-        operator.execute(context=MagicMock())
+        operator.execute(context=mock_context)
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_create_materialized_view(self, mock_hook):
-        body = {
-            "tableReference": {
-                "tableId": TEST_TABLE_ID,
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-            },
-            "materializedView": MATERIALIZED_VIEW_DEFINITION,
-        }
+    def test_create_materialized_view(self, mock_hook, mock_context):
         operator = BigQueryCreateTableOperator(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
             project_id=TEST_GCP_PROJECT_ID,
             table_id=TEST_TABLE_ID,
-            table_resource=body,
+            table_resource=MATERIALIZED_VIEW_TABLE_RESOURCE,
         )
 
-        operator.execute(context=MagicMock())
+        operator.execute(context=mock_context)
 
-        mock_hook.return_value.create_table.assert_called_once_with(
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            table_id=TEST_TABLE_ID,
-            schema_fields=None,
-            table_resource=body,
-            exists_ok=False,
-            location=None,
-            timeout=None,
-        )
+        assert_create_table_called(mock_hook, table_resource=MATERIALIZED_VIEW_TABLE_RESOURCE)
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_create_clustered_table(self, mock_hook):
-        schema_fields = [
-            {"name": "emp_name", "type": "STRING", "mode": "REQUIRED"},
-            {"name": "date_hired", "type": "DATE", "mode": "REQUIRED"},
-            {"name": "date_birth", "type": "DATE", "mode": "NULLABLE"},
-        ]
-        time_partitioning = {"type": "DAY", "field": "date_hired"}
-        cluster_fields = ["date_birth"]
-        body = {
-            "tableReference": {
-                "tableId": TEST_TABLE_ID,
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-            },
-            "schema": schema_fields,
-            "timePartitioning": time_partitioning,
-            "clusterFields": cluster_fields,
-        }
+    def test_create_clustered_table(self, mock_hook, mock_context):
         operator = BigQueryCreateTableOperator(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
             project_id=TEST_GCP_PROJECT_ID,
             table_id=TEST_TABLE_ID,
-            table_resource=body,
+            table_resource=CLUSTERED_TABLE_RESOURCE,
         )
 
-        operator.execute(context=MagicMock())
+        operator.execute(context=mock_context)
 
-        mock_hook.return_value.create_table.assert_called_once_with(
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            table_id=TEST_TABLE_ID,
-            table_resource=body,
-            exists_ok=False,
-            schema_fields=None,
-            timeout=None,
-            location=None,
-        )
+        assert_create_table_called(mock_hook, table_resource=CLUSTERED_TABLE_RESOURCE)
 
     @pytest.mark.parametrize(
         "if_exists, is_conflict, expected_error, log_msg",
@@ -248,127 +269,79 @@ class TestBigQueryCreateTableOperator:
             ("skip", False, None, None),
             ("skip", True, AirflowSkipException, None),
         ],
+        ids=["ignore-ok", "log-ok", "log-conflict", "fail-ok", "fail-conflict", "skip-ok", "skip-conflict"],
     )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_create_existing_table(self, mock_hook, caplog, if_exists, is_conflict, expected_error, log_msg):
-        body = {
-            "tableReference": {
-                "tableId": TEST_TABLE_ID,
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-            },
-            "view": VIEW_DEFINITION,
-        }
+    def test_create_existing_table(
+        self, mock_hook, mock_context, caplog, if_exists, is_conflict, expected_error, log_msg
+    ):
+        caplog.set_level(logging.INFO)
         operator = BigQueryCreateTableOperator(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
             project_id=TEST_GCP_PROJECT_ID,
             table_id=TEST_TABLE_ID,
-            table_resource=body,
+            table_resource=VIEW_TABLE_RESOURCE,
             if_exists=if_exists,
         )
         if is_conflict:
             mock_hook.return_value.create_table.side_effect = Conflict("any")
         else:
             mock_hook.return_value.create_table.side_effect = None
-            if expected_error is not None:
-                with pytest.raises(expected_error):
-                    operator.execute(context=MagicMock())
-            else:
-                operator.execute(context=MagicMock())
-            if log_msg is not None:
-                assert log_msg in caplog.text
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_get_openlineage_facets_on_complete(self, mock_hook):
-        schema_fields = [
-            {"name": "field1", "type": "STRING", "description": "field1 description"},
-            {"name": "field2", "type": "INTEGER"},
-        ]
-        table_resource = {
-            "tableReference": {
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-                "tableId": TEST_TABLE_ID,
-            },
-            "description": "Table description.",
-            "schema": {"fields": schema_fields},
-        }
-        mock_hook.return_value.create_table.return_value = Table.from_api_repr(table_resource)
-        operator = BigQueryCreateTableOperator(
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            table_id=TEST_TABLE_ID,
-            table_resource=table_resource,
-        )
-
-        operator.execute(context=MagicMock())
+        if expected_error is not None:
+            with pytest.raises(expected_error):
+                operator.execute(context=mock_context)
+        else:
+            operator.execute(context=mock_context)
+        if log_msg is not None:
+            assert any(log_msg in record.getMessage() for record in caplog.records)
 
-        mock_hook.return_value.create_table.assert_called_once_with(
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            table_id=TEST_TABLE_ID,
-            table_resource=table_resource,
-            exists_ok=False,
-            schema_fields=None,
-            location=None,
-            timeout=None,
-        )
 
-        result = operator.get_openlineage_facets_on_complete(None)
-        assert not result.run_facets
-        assert not result.job_facets
-        assert not result.inputs
-        assert len(result.outputs) == 1
-        assert result.outputs[0].namespace == BIGQUERY_NAMESPACE
-        assert result.outputs[0].name == f"{TEST_GCP_PROJECT_ID}.{TEST_DATASET}.{TEST_TABLE_ID}"
-        assert result.outputs[0].facets == {
-            "schema": SchemaDatasetFacet(
-                fields=[
-                    SchemaDatasetFacetFields(name="field1", type="STRING", description="field1 description"),
-                    SchemaDatasetFacetFields(name="field2", type="INTEGER"),
-                ]
+class TestBigQuerySimpleExecuteOperators:
+    @pytest.mark.parametrize(
+        "operator_class, operator_kwargs, hook_method, expected_kwargs",
+        [
+            (
+                BigQueryDeleteDatasetOperator,
+                {"delete_contents": TEST_DELETE_CONTENTS},
+                "delete_dataset",
+                {"delete_contents": TEST_DELETE_CONTENTS},
             ),
-            "documentation": DocumentationDatasetFacet(description="Table description."),
-        }
-
-
-class TestBigQueryDeleteDatasetOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        operator = BigQueryDeleteDatasetOperator(
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            delete_contents=TEST_DELETE_CONTENTS,
+            (
+                BigQueryCreateEmptyDatasetOperator,
+                {"location": TEST_DATASET_LOCATION},
+                "create_empty_dataset",
+                {"location": TEST_DATASET_LOCATION, "dataset_reference": {}, "exists_ok": False},
+            ),
+            (BigQueryGetDatasetOperator, {}, "get_dataset", {}),
+            (
+                BigQueryUpdateTableOperator,
+                {"table_id": TEST_TABLE_ID, "table_resource": {"friendlyName": "Test TB"}},
+                "update_table",
+                {"table_id": TEST_TABLE_ID, "table_resource": {"friendlyName": "Test TB"}, "fields": None},
+            ),
+            (
+                BigQueryUpdateDatasetOperator,
+                {"dataset_resource": {"friendlyName": "Test DS"}},
+                "update_dataset",
+                {"dataset_resource": {"friendlyName": "Test DS"}, "fields": ["friendlyName"]},
+            ),
+        ],
+        ids=["delete_dataset", "create_empty_dataset", "get_dataset", "update_table", "update_dataset"],
+    )
+    def test_execute(
+        self, mock_hook, mock_context, operator_class, operator_kwargs, hook_method, expected_kwargs
+    ):
+        operator = operator_class(
+            task_id=TASK_ID, dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID, **operator_kwargs
         )
 
-        operator.execute(None)
-        mock_hook.return_value.delete_dataset.assert_called_once_with(
-            dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID, delete_contents=TEST_DELETE_CONTENTS
+        operator.execute(context=mock_context)
+        getattr(mock_hook.return_value, hook_method).assert_called_once_with(
+            dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID, **expected_kwargs
         )
 
 
 class TestBigQueryCreateEmptyDatasetOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        operator = BigQueryCreateEmptyDatasetOperator(
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            location=TEST_DATASET_LOCATION,
-        )
-
-        operator.execute(context=MagicMock())
-        mock_hook.return_value.create_empty_dataset.assert_called_once_with(
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            location=TEST_DATASET_LOCATION,
-            dataset_reference={},
-            exists_ok=False,
-        )
-
     @pytest.mark.parametrize(
         "if_exists, is_conflict, expected_error, log_msg",
         [
@@ -380,9 +353,12 @@ class TestBigQueryCreateEmptyDatasetOperator:
             ("skip", False, None, None),
             ("skip", True, AirflowSkipException, None),
         ],
+        ids=["ignore-ok", "log-ok", "log-conflict", "fail-ok", "fail-conflict", "skip-ok", "skip-conflict"],
     )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_create_empty_dataset(self, mock_hook, caplog, if_exists, is_conflict, expected_error, log_msg):
+    def test_create_empty_dataset(
+        self, mock_hook, mock_context, caplog, if_exists, is_conflict, expected_error, log_msg
+    ):
+        caplog.set_level(logging.INFO)
         operator = BigQueryCreateEmptyDatasetOperator(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
@@ -396,94 +372,15 @@ class TestBigQueryCreateEmptyDatasetOperator:
             mock_hook.return_value.create_empty_dataset.side_effect = None
         if expected_error is not None:
             with pytest.raises(expected_error):
-                operator.execute(context=MagicMock())
+                operator.execute(context=mock_context)
         else:
-            operator.execute(context=MagicMock())
+            operator.execute(context=mock_context)
         if log_msg is not None:
-            assert log_msg in caplog.text
-
-
-class TestBigQueryGetDatasetOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        operator = BigQueryGetDatasetOperator(
-            task_id=TASK_ID, dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID
-        )
-
-        operator.execute(context=MagicMock())
-        mock_hook.return_value.get_dataset.assert_called_once_with(
-            dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID
-        )
-
-
-class TestBigQueryUpdateTableOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        table_resource = {"friendlyName": "Test TB"}
-        operator = BigQueryUpdateTableOperator(
-            table_resource=table_resource,
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            table_id=TEST_TABLE_ID,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-
-        operator.execute(context=MagicMock())
-        mock_hook.return_value.update_table.assert_called_once_with(
-            table_resource=table_resource,
-            fields=None,
-            dataset_id=TEST_DATASET,
-            table_id=TEST_TABLE_ID,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_get_openlineage_facets_on_complete(self, mock_hook):
-        table_resource = {
-            "tableReference": {
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-                "tableId": TEST_TABLE_ID,
-            },
-            "description": "Table description.",
-            "schema": {
-                "fields": [
-                    {"name": "field1", "type": "STRING", "description": "field1 description"},
-                    {"name": "field2", "type": "INTEGER"},
-                ]
-            },
-        }
-        mock_hook.return_value.update_table.return_value = table_resource
-        operator = BigQueryUpdateTableOperator(
-            table_resource={},
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            table_id=TEST_TABLE_ID,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-
-        operator.execute(context=MagicMock())
-        result = operator.get_openlineage_facets_on_complete(None)
-        assert not result.run_facets
-        assert not result.job_facets
-        assert not result.inputs
-        assert len(result.outputs) == 1
-        assert result.outputs[0].namespace == BIGQUERY_NAMESPACE
-        assert result.outputs[0].name == f"{TEST_GCP_PROJECT_ID}.{TEST_DATASET}.{TEST_TABLE_ID}"
-        assert result.outputs[0].facets == {
-            "schema": SchemaDatasetFacet(
-                fields=[
-                    SchemaDatasetFacetFields(name="field1", type="STRING", description="field1 description"),
-                    SchemaDatasetFacetFields(name="field2", type="INTEGER"),
-                ]
-            ),
-            "documentation": DocumentationDatasetFacet(description="Table description."),
-        }
+            assert any(log_msg in record.getMessage() for record in caplog.records)
 
 
 class TestBigQueryUpdateTableSchemaOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
+    def test_execute(self, mock_hook, mock_context):
         schema_field_updates = [
             {
                 "name": "emp_name",
@@ -501,7 +398,7 @@ class TestBigQueryUpdateTableSchemaOperator:
             location=TEST_DATASET_LOCATION,
             impersonation_chain=["service-account@myproject.iam.gserviceaccount.com"],
         )
-        operator.execute(context=MagicMock())
+        operator.execute(context=mock_context)
 
         mock_hook.assert_called_once_with(
             gcp_conn_id=GCP_CONN_ID,
@@ -516,41 +413,70 @@ class TestBigQueryUpdateTableSchemaOperator:
             project_id=TEST_GCP_PROJECT_ID,
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_get_openlineage_facets_on_complete(self, mock_hook):
-        table_resource = {
-            "tableReference": {
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-                "tableId": TEST_TABLE_ID,
-            },
-            "description": "Table description.",
-            "schema": {
-                "fields": [
-                    {"name": "field1", "type": "STRING", "description": "field1 description"},
-                    {"name": "field2", "type": "INTEGER"},
-                ]
-            },
-        }
-        mock_hook.return_value.update_table_schema.return_value = table_resource
-        schema_field_updates = [
-            {
-                "name": "emp_name",
-                "description": "Name of employee",
-            }
-        ]
 
-        operator = BigQueryUpdateTableSchemaOperator(
-            schema_fields_updates=schema_field_updates,
-            include_policy_tags=False,
+class TestBigQueryTableOperatorsOpenLineage:
+    @pytest.mark.parametrize(
+        "operator_class, operator_kwargs, hook_method, hook_result, expected_call_kwargs",
+        [
+            (
+                BigQueryCreateTableOperator,
+                {"table_resource": TABLE_RESOURCE_WITH_SCHEMA},
+                "create_table",
+                Table.from_api_repr,
+                {
+                    "table_resource": TABLE_RESOURCE_WITH_SCHEMA,
+                    "exists_ok": False,
+                    "schema_fields": None,
+                    "location": None,
+                    "timeout": None,
+                },
+            ),
+            (
+                BigQueryUpdateTableOperator,
+                {"table_resource": {}},
+                "update_table",
+                dict,
+                {"table_resource": {}, "fields": None},
+            ),
+            (
+                BigQueryUpdateTableSchemaOperator,
+                {"schema_fields_updates": [{"name": "emp_name", "description": "Name of employee"}]},
+                "update_table_schema",
+                dict,
+                {
+                    "schema_fields_updates": [{"name": "emp_name", "description": "Name of employee"}],
+                    "include_policy_tags": False,
+                },
+            ),
+        ],
+        ids=["create_table", "update_table", "update_table_schema"],
+    )
+    def test_get_openlineage_facets_on_complete(
+        self,
+        mock_hook,
+        mock_context,
+        operator_class,
+        operator_kwargs,
+        hook_method,
+        hook_result,
+        expected_call_kwargs,
+    ):
+        getattr(mock_hook.return_value, hook_method).return_value = hook_result(TABLE_RESOURCE_WITH_SCHEMA)
+        operator = operator_class(
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
             table_id=TEST_TABLE_ID,
             project_id=TEST_GCP_PROJECT_ID,
-            location=TEST_DATASET_LOCATION,
-            impersonation_chain=["service-account@myproject.iam.gserviceaccount.com"],
+            **operator_kwargs,
+        )
+
+        operator.execute(context=mock_context)
+        getattr(mock_hook.return_value, hook_method).assert_called_once_with(
+            dataset_id=TEST_DATASET,
+            table_id=TEST_TABLE_ID,
+            project_id=TEST_GCP_PROJECT_ID,
+            **expected_call_kwargs,
         )
-        operator.execute(context=MagicMock())
 
         result = operator.get_openlineage_facets_on_complete(None)
         assert not result.run_facets
@@ -560,39 +486,13 @@ class TestBigQueryUpdateTableSchemaOperator:
         assert result.outputs[0].namespace == BIGQUERY_NAMESPACE
         assert result.outputs[0].name == f"{TEST_GCP_PROJECT_ID}.{TEST_DATASET}.{TEST_TABLE_ID}"
         assert result.outputs[0].facets == {
-            "schema": SchemaDatasetFacet(
-                fields=[
-                    SchemaDatasetFacetFields(name="field1", type="STRING", description="field1 description"),
-                    SchemaDatasetFacetFields(name="field2", type="INTEGER"),
-                ]
-            ),
-            "documentation": DocumentationDatasetFacet(description="Table description."),
+            "schema": EXPECTED_SCHEMA_FACET,
+            "documentation": EXPECTED_DOCUMENTATION_FACET,
         }
 
 
-class TestBigQueryUpdateDatasetOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        dataset_resource = {"friendlyName": "Test DS"}
-        operator = BigQueryUpdateDatasetOperator(
-            dataset_resource=dataset_resource,
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-
-        operator.execute(context=MagicMock())
-        mock_hook.return_value.update_dataset.assert_called_once_with(
-            dataset_resource=dataset_resource,
-            dataset_id=TEST_DATASET,
-            project_id=TEST_GCP_PROJECT_ID,
-            fields=list(dataset_resource.keys()),
-        )
-
-
 class TestBigQueryGetDataOperator:
     @pytest.mark.parametrize("as_dict", [True, False])
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
     def test_execute__table(self, mock_hook, as_dict):
         max_results = 100
         selected_fields = "DATE"
@@ -620,7 +520,6 @@ class TestBigQueryGetDataOperator:
         )
 
     @pytest.mark.parametrize("as_dict", [True, False])
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
     def test_execute__job_id(self, mock_hook, as_dict):
         max_results = 100
         selected_fields = "DATE"
@@ -643,8 +542,8 @@ class TestBigQueryGetDataOperator:
             selected_fields=selected_fields,
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute__job_id_table_id_mutual_exclusive_exception(self, _):
+    @pytest.mark.usefixtures("mock_hook")
+    def test_execute__job_id_table_id_mutual_exclusive_exception(self):
         max_results = 100
         selected_fields = "DATE"
         operator = BigQueryGetDataOperator(
@@ -661,140 +560,84 @@ class TestBigQueryGetDataOperator:
         with pytest.raises(AirflowException, match="mutually exclusive"):
             operator.execute(None)
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_generate_query__with_table_project_id(self, mock_hook):
-        operator = BigQueryGetDataOperator(
-            gcp_conn_id=GCP_CONN_ID,
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            table_id=TEST_TABLE_ID,
-            table_project_id=TEST_GCP_PROJECT_ID,
-            max_results=100,
-            use_legacy_sql=False,
-        )
-        assert (
-            operator.generate_query(hook=mock_hook) == f"select * from `{TEST_GCP_PROJECT_ID}."
-            f"{TEST_DATASET}.{TEST_TABLE_ID}` limit 100"
-        )
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_generate_query__without_table_project_id(self, mock_hook):
-        hook_project_id = mock_hook.project_id
+    @pytest.mark.parametrize(
+        "table_project_id",
+        [TEST_GCP_PROJECT_ID, None],
+        ids=["with_table_project_id", "without_table_project_id"],
+    )
+    def test_generate_query(self, mock_hook, table_project_id):
         operator = BigQueryGetDataOperator(
             gcp_conn_id=GCP_CONN_ID,
             task_id=TASK_ID,
             dataset_id=TEST_DATASET,
             table_id=TEST_TABLE_ID,
+            table_project_id=table_project_id,
             max_results=100,
             use_legacy_sql=False,
         )
+        project_id = table_project_id or mock_hook.project_id
         assert (
-            operator.generate_query(hook=mock_hook) == f"select * from `{hook_project_id}."
+            operator.generate_query(hook=mock_hook) == f"select * from `{project_id}."
             f"{TEST_DATASET}.{TEST_TABLE_ID}` limit 100"
         )
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_get_data_operator_async_with_selected_fields(
-        self, mock_hook, create_task_instance_of_operator
-    ):
-        """
-        Asserts that a task is deferred and a BigQuerygetDataTrigger will be fired
-        when the BigQueryGetDataOperator is executed with deferrable=True.
-        """
-        ti = create_task_instance_of_operator(
-            BigQueryGetDataOperator,
-            dag_id="dag_id",
-            task_id="get_data_from_bq",
-            dataset_id=TEST_DATASET,
-            table_id=TEST_TABLE_ID,
-            job_project_id=TEST_JOB_PROJECT_ID,
-            max_results=100,
-            selected_fields="value,name",
-            deferrable=True,
-            use_legacy_sql=False,
-        )
-
-        with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
-
-        assert isinstance(exc.value.trigger, BigQueryGetDataTrigger), (
-            "Trigger is not a BigQueryGetDataTrigger"
-        )
-
-    @pytest.mark.db_test
-    @pytest.mark.parametrize("as_dict", [True, False])
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_get_data_operator_async_without_selected_fields(
-        self, mock_hook, create_task_instance_of_operator, as_dict
-    ):
+    @pytest.mark.parametrize(
+        "selected_fields, as_dict",
+        [("value,name", False), (None, True), (None, False)],
+        ids=["selected_fields", "as_dict", "as_list"],
+    )
+    def test_bigquery_get_data_operator_async(self, mock_hook, mock_context, selected_fields, as_dict):
         """
         Asserts that a task is deferred and a BigQueryGetDataTrigger will be fired
         when the BigQueryGetDataOperator is executed with deferrable=True.
         """
-        ti = create_task_instance_of_operator(
-            BigQueryGetDataOperator,
-            dag_id="dag_id",
+        operator = BigQueryGetDataOperator(
             task_id="get_data_from_bq",
             dataset_id=TEST_DATASET,
             table_id=TEST_TABLE_ID,
             job_project_id=TEST_JOB_PROJECT_ID,
             max_results=100,
+            selected_fields=selected_fields,
             deferrable=True,
             as_dict=as_dict,
             use_legacy_sql=False,
         )
 
         with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert isinstance(exc.value.trigger, BigQueryGetDataTrigger), (
             "Trigger is not a BigQueryGetDataTrigger"
         )
 
-    @pytest.mark.parametrize("as_dict", [True, False])
-    def test_bigquery_get_data_operator_execute_failure(self, as_dict):
-        """Tests that an AirflowException is raised in case of error event"""
-
-        operator = BigQueryGetDataOperator(
+    @pytest.fixture(params=[True, False], ids=["as_dict", "as_list"])
+    def deferrable_operator(self, request):
+        return BigQueryGetDataOperator(
             task_id="get_data_from_bq",
             dataset_id=TEST_DATASET,
             table_id="any",
             job_project_id=TEST_JOB_PROJECT_ID,
             max_results=100,
             deferrable=True,
-            as_dict=as_dict,
+            as_dict=request.param,
             use_legacy_sql=False,
         )
 
+    def test_bigquery_get_data_operator_execute_failure(self, deferrable_operator):
+        """Tests that an AirflowException is raised in case of error event"""
         with pytest.raises(AirflowException):
-            operator.execute_complete(
+            deferrable_operator.execute_complete(
                 context=None, event={"status": "error", "message": "test failure message"}
             )
 
-    @pytest.mark.parametrize("as_dict", [True, False])
-    def test_bigquery_get_data_op_execute_complete_with_records(self, as_dict):
+    def test_bigquery_get_data_op_execute_complete_with_records(self, deferrable_operator):
         """Asserts that exception is raised with correct expected exception message"""
-
-        operator = BigQueryGetDataOperator(
-            task_id="get_data_from_bq",
-            dataset_id=TEST_DATASET,
-            table_id="any",
-            job_project_id=TEST_JOB_PROJECT_ID,
-            max_results=100,
-            deferrable=True,
-            as_dict=as_dict,
-            use_legacy_sql=False,
-        )
-
-        with mock.patch.object(operator.log, "info") as mock_log_info:
-            operator.execute_complete(context=None, event={"status": "success", "records": [20]})
+        with mock.patch.object(deferrable_operator.log, "info") as mock_log_info:
+            deferrable_operator.execute_complete(context=None, event={"status": "success", "records": [20]})
         mock_log_info.assert_called_with("Total extracted rows: %s", 1)
 
     @pytest.mark.parametrize("as_dict", [True, False])
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
-    def test_encryption_configuration(self, mock_job, mock_hook, as_dict):
+    def test_encryption_configuration(self, mock_job, mock_hook, mock_context, as_dict):
         encryption_configuration = {
             "kmsKeyName": "projects/PROJECT/locations/LOCATION/keyRings/KEY_RING/cryptoKeys/KEY",
         }
@@ -819,7 +662,7 @@ class TestBigQueryGetDataOperator:
             deferrable=True,
         )
         with pytest.raises(TaskDeferred):
-            operator.execute(MagicMock())
+            operator.execute(mock_context)
         mock_hook.return_value.insert_job.assert_called_with(
             configuration={
                 "query": {
@@ -836,32 +679,26 @@ class TestBigQueryGetDataOperator:
 
 
 class TestBigQueryTableDeleteOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        ignore_if_missing = True
-        deletion_dataset_table = f"{TEST_DATASET}.{TEST_TABLE_ID}"
+    @pytest.fixture(scope="class")
+    def executed_operator(self):
+        with mock.patch.object(bigquery_operators, "BigQueryHook") as mock_hook:
+            mock_hook.return_value.project_id = "default_project_id"
+            operator = BigQueryDeleteTableOperator(
+                task_id=TASK_ID,
+                deletion_dataset_table=f"{TEST_DATASET}.{TEST_TABLE_ID}",
+                ignore_if_missing=True,
+            )
+            operator.execute(None)
+            yield operator, mock_hook
 
-        operator = BigQueryDeleteTableOperator(
-            task_id=TASK_ID,
-            deletion_dataset_table=deletion_dataset_table,
-            ignore_if_missing=ignore_if_missing,
+    def test_execute(self, executed_operator):
+        _, mock_hook = executed_operator
+        mock_hook.return_value.delete_table.assert_called_once_with(
+            table_id=f"{TEST_DATASET}.{TEST_TABLE_ID}", not_found_ok=True
         )
 
-        operator.execute(None)
-        mock_hook.return_value.delete_table.assert_called_once_with(
-            table_id=deletion_dataset_table, not_found_ok=ignore_if_missing
-        )
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_get_openlineage_facets_on_complete(self, mock_hook):
-        mock_hook.return_value.project_id = "default_project_id"
-        operator = BigQueryDeleteTableOperator(
-            task_id=TASK_ID,
-            deletion_dataset_table=f"{TEST_DATASET}.{TEST_TABLE_ID}",
-            ignore_if_missing=True,
-        )
-
-        operator.execute(None)
+    def test_get_openlineage_facets_on_complete(self, executed_operator):
+        operator, _ = executed_operator
         result = operator.get_openlineage_facets_on_complete(None)
         assert not result.run_facets
         assert not result.job_facets
@@ -881,7 +718,6 @@ class TestBigQueryTableDeleteOperator:
 
 
 class TestBigQueryGetDatasetTablesOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
     def test_execute(self, mock_hook):
         operator = BigQueryGetDatasetTablesOperator(
             task_id=TASK_ID, dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID, max_results=2
@@ -895,67 +731,48 @@ class TestBigQueryGetDatasetTablesOperator:
         )
 
 
-@pytest.mark.parametrize(
-    "operator_class, kwargs",
-    [
-        (BigQueryCheckOperator, dict(sql="Select * from test_table")),
-        (BigQueryValueCheckOperator, dict(sql="Select * from test_table", pass_value=95)),
-        (BigQueryIntervalCheckOperator, dict(table=TEST_TABLE_ID, metrics_thresholds={"COUNT(*)": 1.5})),
-    ],
-)
 class TestBigQueryCheckOperators:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery._BigQueryDbHookMixin.get_db_hook")
-    def test_get_db_hook(
-        self,
-        mock_get_db_hook,
-        operator_class,
-        kwargs,
-    ):
-        operator = operator_class(task_id=TASK_ID, gcp_conn_id="google_cloud_default", **kwargs)
-        operator.get_db_hook()
+    @pytest.fixture(
+        scope="class",
+        params=[
+            (BigQueryCheckOperator, dict(sql="Select * from test_table")),
+            (BigQueryValueCheckOperator, dict(sql="Select * from test_table", pass_value=95)),
+            (BigQueryIntervalCheckOperator, dict(table=TEST_TABLE_ID, metrics_thresholds={"COUNT(*)": 1.5})),
+        ],
+        ids=["check", "value_check", "interval_check"],
+    )
+    def check_operator(self, request):
+        operator_class, kwargs = request.param
+        return operator_class(task_id=TASK_ID, gcp_conn_id="google_cloud_default", **kwargs)
+
+    @mock.patch.object(bigquery_operators._BigQueryDbHookMixin, "get_db_hook")
+    def test_get_db_hook(self, mock_get_db_hook, check_operator):
+        check_operator.get_db_hook()
         mock_get_db_hook.assert_called_once()
 
 
 class TestBigQueryUpsertTableOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute(self, mock_hook):
-        operator = BigQueryUpsertTableOperator(
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            table_resource=TEST_TABLE_RESOURCES,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
+    @pytest.fixture(scope="class")
+    def executed_operator(self):
+        with mock.patch.object(bigquery_operators, "BigQueryHook") as mock_hook:
+            mock_hook.return_value.run_table_upsert.return_value = TABLE_RESOURCE_WITH_SCHEMA
+            operator = BigQueryUpsertTableOperator(
+                task_id=TASK_ID,
+                dataset_id=TEST_DATASET,
+                table_resource=TEST_TABLE_RESOURCES,
+                project_id=TEST_GCP_PROJECT_ID,
+            )
+            operator.execute(context=MagicMock())
+            yield operator, mock_hook
 
-        operator.execute(context=MagicMock())
+    def test_execute(self, executed_operator):
+        _, mock_hook = executed_operator
         mock_hook.return_value.run_table_upsert.assert_called_once_with(
             dataset_id=TEST_DATASET, project_id=TEST_GCP_PROJECT_ID, table_resource=TEST_TABLE_RESOURCES
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_get_openlineage_facets_on_complete(self, mock_hook):
-        table_resource = {
-            "tableReference": {
-                "projectId": TEST_GCP_PROJECT_ID,
-                "datasetId": TEST_DATASET,
-                "tableId": TEST_TABLE_ID,
-            },
-            "description": "Table description.",
-            "schema": {
-                "fields": [
-                    {"name": "field1", "type": "STRING", "description": "field1 description"},
-                    {"name": "field2", "type": "INTEGER"},
-                ]
-            },
-        }
-        mock_hook.return_value.run_table_upsert.return_value = table_resource
-        operator = BigQueryUpsertTableOperator(
-            task_id=TASK_ID,
-            dataset_id=TEST_DATASET,
-            table_resource=TEST_TABLE_RESOURCES,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        operator.execute(context=MagicMock())
-
+    def test_get_openlineage_facets_on_complete(self, executed_operator):
+        operator, _ = executed_operator
         result = operator.get_openlineage_facets_on_complete(None)
         assert not result.run_facets
         assert not result.job_facets
@@ -964,244 +781,129 @@ class TestBigQueryUpsertTableOperator:
         assert result.outputs[0].namespace == BIGQUERY_NAMESPACE
         assert result.outputs[0].name == f"{TEST_GCP_PROJECT_ID}.{TEST_DATASET}.{TEST_TABLE_ID}"
         assert result.outputs[0].facets == {
-            "schema": SchemaDatasetFacet(
-                fields=[
-                    SchemaDatasetFacetFields(name="field1", type="STRING", description="field1 description"),
-                    SchemaDatasetFacetFields(name="field2", type="INTEGER"),
-                ]
-            ),
-            "documentation": DocumentationDatasetFacet(description="Table description."),
+            "schema": EXPECTED_SCHEMA_FACET,
+            "documentation": EXPECTED_DOCUMENTATION_FACET,
         }
 
 
 class TestBigQueryInsertJobOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_query_success(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
-
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        result = op.execute(context=MagicMock())
-        assert configuration["labels"] == {"airflow-dag": "adhoc_airflow", "airflow-task": "insert_query_job"}
-
-        mock_hook.return_value.insert_job.assert_called_once_with(
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=real_job_id,
-            nowait=True,
-            project_id=TEST_GCP_PROJECT_ID,
-            retry=DEFAULT_RETRY,
-            timeout=None,
-        )
-
-        assert result == real_job_id
+    @pytest.fixture
+    def make_insert_op(self):
+        def _make(**kwargs):
+            return BigQueryInsertJobOperator(
+                **{
+                    "task_id": "insert_query_job",
+                    "configuration": copy.deepcopy(TEST_QUERY_CONFIGURATION),
+                    "location": TEST_DATASET_LOCATION,
+                    "job_id": TEST_INSERT_JOB_ID,
+                    "project_id": TEST_GCP_PROJECT_ID,
+                    **kwargs,
+                }
+            )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_copy_success(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
+        return _make
 
-        configuration = {
-            "copy": {
-                "sourceTable": "aaa",
-                "destinationTable": "bbb",
-            }
-        }
-        mock_configuration = {
+    @pytest.mark.parametrize(
+        "task_id, configuration, operator_kwargs",
+        [
+            ("insert_query_job", TEST_QUERY_CONFIGURATION, {}),
+            ("copy_query_job", {"copy": {"sourceTable": "aaa", "destinationTable": "bbb"}}, {}),
+            (
+                "insert_query_job",
+                TEST_QUERY_CONFIGURATION,
+                {"force_rerun": True},
+            ),
+        ],
+        ids=["query", "copy", "force_rerun"],
+    )
+    def test_execute_success(
+        self, mock_hook, mock_context, task_id, configuration, operator_kwargs, make_insert_op
+    ):
+        configuration = copy.deepcopy(configuration)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(TEST_REAL_JOB_ID)
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
+        mock_hook.return_value.insert_job.return_value.to_api_repr.return_value = {
             "configuration": configuration,
             "jobReference": "a",
         }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
-        mock_hook.return_value.insert_job.return_value.to_api_repr.return_value = mock_configuration
 
-        op = BigQueryInsertJobOperator(
-            task_id="copy_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        result = op.execute(context=MagicMock())
-        assert configuration["labels"] == {"airflow-dag": "adhoc_airflow", "airflow-task": "copy_query_job"}
+        op = make_insert_op(task_id=task_id, configuration=configuration, **operator_kwargs)
+        result = op.execute(context=mock_context)
+        assert configuration["labels"] == {"airflow-dag": "adhoc_airflow", "airflow-task": task_id}
 
         mock_hook.return_value.insert_job.assert_called_once_with(
             configuration=configuration,
             location=TEST_DATASET_LOCATION,
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             nowait=True,
             project_id=TEST_GCP_PROJECT_ID,
             retry=DEFAULT_RETRY,
             timeout=None,
         )
 
-        assert result == real_job_id
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_on_kill(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
+        assert result == TEST_REAL_JOB_ID
 
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+    @pytest.mark.parametrize("cancel_on_kill", [False, True], ids=["no_cancel", "cancel"])
+    def test_on_kill(self, make_insert_op, cancel_on_kill):
+        op = make_insert_op(cancel_on_kill=cancel_on_kill)
+        op.job_id = TEST_REAL_JOB_ID
+        op.hook = MagicMock()
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            cancel_on_kill=False,
-        )
-        op.execute(context=MagicMock())
-
-        op.on_kill()
-        mock_hook.return_value.cancel_job.assert_not_called()
-
-        op.cancel_on_kill = True
         op.on_kill()
-        mock_hook.return_value.cancel_job.assert_called_once_with(
-            job_id=real_job_id,
-            location=TEST_DATASET_LOCATION,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
-    def test_on_kill_after_execution_timeout(self, mock_job, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-
-        mock_job.job_id = real_job_id
-        mock_job.error_result = False
-        mock_job.state = "DONE"
-        mock_job.result.side_effect = AirflowTaskTimeout()
+        if cancel_on_kill:
+            op.hook.cancel_job.assert_called_once_with(
+                job_id=TEST_REAL_JOB_ID,
+                location=TEST_DATASET_LOCATION,
+                project_id=TEST_GCP_PROJECT_ID,
+            )
+        else:
+            op.hook.cancel_job.assert_not_called()
 
-        mock_hook.return_value.insert_job.return_value = mock_job
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+    def test_on_kill_after_execution_timeout(self, mock_hook, mock_context, make_insert_op):
+        job = create_bigquery_job(TEST_REAL_JOB_ID)
+        job.result.side_effect = AirflowTaskTimeout()
+        mock_hook.return_value.insert_job.return_value = job
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            cancel_on_kill=True,
-        )
+        op = make_insert_op(cancel_on_kill=True)
         with pytest.raises(AirflowTaskTimeout):
-            op.execute(context=MagicMock())
+            op.execute(context=mock_context)
 
         op.on_kill()
         mock_hook.return_value.cancel_job.assert_called_once_with(
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             location=TEST_DATASET_LOCATION,
             project_id=TEST_GCP_PROJECT_ID,
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_failure(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=True
+    def test_execute_failure(self, mock_hook, mock_context, make_insert_op):
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(
+            TEST_REAL_JOB_ID, error_result=True
         )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
+        op = make_insert_op()
         with pytest.raises(AirflowException):
-            op.execute(context=MagicMock())
-
-    @mock.patch(
-        "airflow.providers.google.cloud.operators.bigquery.BigQueryInsertJobOperator._handle_job_error"
-    )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_reattach(self, mock_hook, _handle_job_error):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
+            op.execute(context=mock_context)
 
+    @mock.patch.object(BigQueryInsertJobOperator, "_handle_job_error")
+    def test_execute_reattach(self, _handle_job_error, mock_hook, mock_context, make_insert_op):
         mock_hook.return_value.insert_job.side_effect = Conflict("any")
         job = MagicMock(
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             error_result=False,
             state="RUNNING",
             done=lambda: False,
         )
         mock_hook.return_value.get_job.return_value = job
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            reattach_states={"PENDING", "RUNNING"},
-        )
-        result = op.execute(context=MagicMock())
+        op = make_insert_op(reattach_states={"PENDING", "RUNNING"})
+        result = op.execute(context=mock_context)
 
         mock_hook.return_value.get_job.assert_called_once_with(
             location=TEST_DATASET_LOCATION,
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             project_id=TEST_GCP_PROJECT_ID,
         )
 
@@ -1210,256 +912,105 @@ class TestBigQueryInsertJobOperator:
             timeout=None,
         )
 
-        assert result == real_job_id
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_reattach_to_done_state(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
+        assert result == TEST_REAL_JOB_ID
 
+    def test_execute_reattach_to_done_state(self, mock_hook, mock_context, make_insert_op):
         mock_hook.return_value.insert_job.side_effect = Conflict("any")
-        job = MagicMock(
-            job_id=real_job_id,
+        job = SimpleNamespace(
+            job_id=TEST_REAL_JOB_ID,
             error_result=False,
             state="DONE",
             done=lambda: False,
         )
         mock_hook.return_value.get_job.return_value = job
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            reattach_states={"PENDING"},
-        )
+        op = make_insert_op(reattach_states={"PENDING"})
         with pytest.raises(AirflowException):
             # Not possible to reattach to any state if job is already DONE
-            op.execute(context=MagicMock())
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_force_rerun(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-
-        job = MagicMock(
-            state="DONE",
-            job_id=real_job_id,
-            error_result=False,
-        )
-        mock_hook.return_value.insert_job.return_value = job
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
-
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            force_rerun=True,
-        )
-        result = op.execute(context=MagicMock())
-
-        mock_hook.return_value.insert_job.assert_called_once_with(
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=real_job_id,
-            nowait=True,
-            project_id=TEST_GCP_PROJECT_ID,
-            retry=DEFAULT_RETRY,
-            timeout=None,
-        )
-
-        assert result == real_job_id
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_no_force_rerun(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
+            op.execute(context=mock_context)
 
+    def test_execute_no_force_rerun(self, mock_hook, mock_context, make_insert_op):
         mock_hook.return_value.insert_job.side_effect = Conflict("any")
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
-        job = MagicMock(
-            job_id=real_job_id,
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
+        job = SimpleNamespace(
+            job_id=TEST_REAL_JOB_ID,
             error_result=False,
             state="DONE",
             done=lambda: True,
         )
         mock_hook.return_value.get_job.return_value = job
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            reattach_states={"PENDING"},
-        )
+        op = make_insert_op(reattach_states={"PENDING"})
         # No force rerun
         with pytest.raises(AirflowException):
-            op.execute(context=MagicMock())
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryInsertJobOperator.defer")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_insert_job_operator_async_finish_before_deferred(self, mock_hook, mock_defer, caplog):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
+            op.execute(context=mock_context)
 
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
+    @mock.patch.object(BigQueryInsertJobOperator, "defer")
+    def test_bigquery_insert_job_operator_async_finish_before_deferred(
+        self, mock_defer, mock_hook, caplog, mock_context, make_insert_op
+    ):
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(TEST_REAL_JOB_ID)
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            deferrable=True,
-        )
+        op = make_insert_op(deferrable=True)
 
-        result = op.execute(context=MagicMock())
+        result = op.execute(context=mock_context)
 
         assert not mock_defer.called
         assert "Current state of job" in caplog.text
-        assert result == real_job_id
-
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryInsertJobOperator.defer")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_insert_job_operator_async_error_before_deferred(self, mock_hook, mock_defer, caplog):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
+        assert result == TEST_REAL_JOB_ID
 
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=True
+    @mock.patch.object(BigQueryInsertJobOperator, "defer")
+    def test_bigquery_insert_job_operator_async_error_before_deferred(
+        self, mock_defer, mock_hook, caplog, mock_context, make_insert_op
+    ):
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(
+            TEST_REAL_JOB_ID, error_result=True
         )
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            deferrable=True,
-        )
+        op = make_insert_op(deferrable=True)
 
         with pytest.raises(AirflowException) as exc:
-            op.execute(MagicMock())
+            op.execute(mock_context)
 
-        assert str(exc.value) == f"BigQuery job {real_job_id} failed: True"
+        assert str(exc.value) == f"BigQuery job {TEST_REAL_JOB_ID} failed: True"
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_insert_job_operator_async(self, mock_hook, create_task_instance_of_operator):
+    def test_bigquery_insert_job_operator_async(self, mock_hook, mock_context, make_insert_op):
         """
         Asserts that a task is deferred and a BigQueryInsertJobTrigger will be fired
         when the BigQueryInsertJobOperator is executed with deferrable=True.
         """
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=False)
 
-        ti = create_task_instance_of_operator(
-            BigQueryInsertJobOperator,
-            dag_id="dag_id",
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            deferrable=True,
+        mock_hook.return_value.insert_job.return_value = MagicMock(
+            job_id=TEST_REAL_JOB_ID, error_result=False
         )
 
+        operator = make_insert_op(deferrable=True)
+
         with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert isinstance(exc.value.trigger, BigQueryInsertJobTrigger), (
             "Trigger is not a BigQueryInsertJobTrigger"
         )
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
     def test_bigquery_insert_job_operator_async_inherits_hook_project_id_when_non_given(
-        self, mock_hook, create_task_instance_of_operator
+        self, mock_hook, mock_context, make_insert_op
     ):
         """
         Asserts that a deferred task of type BigQueryInsertJobTrigger will assume the project_id
         of the hook that is used within the BigQueryInsertJobOperator when there is no
         project_id passed to the BigQueryInsertJobOperator.
         """
-        job_id = "123456"
 
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
         mock_hook.return_value.project_id = TEST_GCP_PROJECT_ID
 
-        ti = create_task_instance_of_operator(
-            BigQueryInsertJobOperator,
-            dag_id="dag_id",
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            deferrable=True,
-            project_id=None,
-        )
+        operator = make_insert_op(deferrable=True, project_id=None)
 
         with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert isinstance(exc.value.trigger, BigQueryInsertJobTrigger), (
             "Trigger is not a BigQueryInsertJobTrigger"
@@ -1467,182 +1018,101 @@ class TestBigQueryInsertJobOperator:
 
         assert exc.value.trigger.project_id == TEST_GCP_PROJECT_ID
 
-    def test_bigquery_insert_job_operator_execute_failure(self):
+    def test_bigquery_insert_job_operator_execute_failure(self, make_insert_op):
         """Tests that an AirflowException is raised in case of error event"""
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        job_id = "123456"
 
-        operator = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            deferrable=True,
-        )
+        operator = make_insert_op(deferrable=True)
 
         with pytest.raises(AirflowException):
             operator.execute_complete(
                 context=None, event={"status": "error", "message": "test failure message"}
             )
 
-    @pytest.mark.db_test
-    def test_bigquery_insert_job_operator_execute_complete(self, create_task_instance_of_operator):
+    def test_bigquery_insert_job_operator_execute_complete(self, mock_context, make_insert_op):
         """Asserts that logging occurs as expected"""
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        job_id = "123456"
 
-        ti = create_task_instance_of_operator(
-            BigQueryInsertJobOperator,
-            dag_id="dag_id",
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            deferrable=True,
-        )
-        operator = ti.task
+        operator = make_insert_op(deferrable=True)
         with mock.patch.object(operator.log, "info") as mock_log_info:
             operator.execute_complete(
-                context=MagicMock(),
-                event={"status": "success", "message": "Job completed", "job_id": job_id},
+                context=mock_context,
+                event={"status": "success", "message": "Job completed", "job_id": TEST_INSERT_JOB_ID},
             )
         mock_log_info.assert_called_with(
             "%s completed with response %s ", "insert_query_job", "Job completed"
         )
 
-    def test_bigquery_insert_job_operator_execute_complete_reassigns_job_id(self):
+    def test_bigquery_insert_job_operator_execute_complete_reassigns_job_id(
+        self, mock_context, make_insert_op
+    ):
         """Assert that we use job_id from event after deferral."""
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-        job_id = "123456"
 
-        operator = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
+        operator = make_insert_op(
             job_id=None,  # We are not passing anything here on purpose
-            project_id=TEST_GCP_PROJECT_ID,
             deferrable=True,
         )
 
         returned_job_id = operator.execute_complete(
-            context=MagicMock(),
-            event={"status": "success", "message": "Job completed", "job_id": job_id},
+            context=mock_context,
+            event={"status": "success", "message": "Job completed", "job_id": TEST_INSERT_JOB_ID},
         )
-        assert returned_job_id == job_id
-        assert operator.job_id == job_id
+        assert returned_job_id == TEST_INSERT_JOB_ID
+        assert operator.job_id == TEST_INSERT_JOB_ID
 
-    @pytest.mark.db_test
-    @mock.patch(
-        "airflow.providers.google.cloud.operators.bigquery.BigQueryInsertJobOperator._handle_job_error"
-    )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
+    @mock.patch.object(BigQueryInsertJobOperator, "_handle_job_error")
     def test_bigquery_insert_job_operator_with_job_id_generate(
-        self, mock_hook, _handle_job_error, create_task_instance_of_operator
+        self, _handle_job_error, mock_hook, mock_context, make_insert_op
     ):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
-
         mock_hook.return_value.insert_job.side_effect = Conflict("any")
         job = MagicMock(
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             error_result=False,
             state="PENDING",
             done=lambda: False,
         )
         mock_hook.return_value.get_job.return_value = job
 
-        ti = create_task_instance_of_operator(
-            BigQueryInsertJobOperator,
-            dag_id="adhoc_airflow",
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            reattach_states={"PENDING"},
-            deferrable=True,
-        )
+        operator = make_insert_op(reattach_states={"PENDING"}, deferrable=True)
 
         with pytest.raises(TaskDeferred):
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         mock_hook.return_value.generate_job_id.assert_called_once_with(
-            job_id=job_id,
+            job_id=TEST_INSERT_JOB_ID,
             dag_id="adhoc_airflow",
             task_id="insert_query_job",
             logical_date=ANY,
             run_after=ANY,
-            configuration=configuration,
+            configuration=operator.configuration,
             force_rerun=True,
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_openlineage_events(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM test_table",
-                "useLegacySql": False,
-            }
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
-
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        result = op.execute(context=MagicMock())
-
+    def test_execute_openlineage_events(self, mock_hook, mock_context, make_insert_op):
+        configuration = {
+            "query": {
+                "query": "SELECT * FROM test_table",
+                "useLegacySql": False,
+            }
+        }
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(TEST_REAL_JOB_ID)
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
+
+        op = make_insert_op(configuration=configuration)
+        result = op.execute(context=mock_context)
+
         mock_hook.return_value.insert_job.assert_called_once_with(
             configuration=configuration,
             location=TEST_DATASET_LOCATION,
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             nowait=True,
             project_id=TEST_GCP_PROJECT_ID,
             retry=DEFAULT_RETRY,
             timeout=None,
         )
 
-        assert result == real_job_id
+        assert result == TEST_REAL_JOB_ID
 
-        with open(os.path.dirname(__file__) + "/../utils/query_job_details.json") as f:
-            job_details = json.loads(f.read())
-        mock_hook.return_value.get_client.return_value.get_job.return_value._properties = job_details
-        mock_hook.return_value.get_client.return_value.get_table.side_effect = Exception()
+        mock_hook.return_value.get_client.return_value.get_job.return_value._properties = QUERY_JOB_DETAILS
+        mock_hook.return_value.get_client.return_value.get_table.side_effect = Exception
 
         lineage = op.get_openlineage_facets_on_complete(None)
         assert lineage.inputs == [
@@ -1655,8 +1125,7 @@ class TestBigQueryInsertJobOperator:
         }
         assert lineage.job_facets == {"sql": SQLJobFacet(query="SELECT * FROM test_table")}
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_fails_openlineage_events(self, mock_hook):
+    def test_execute_fails_openlineage_events(self, mock_hook, mock_context):
         job_id = "1234"
 
         configuration = {
@@ -1673,56 +1142,45 @@ class TestBigQueryInsertJobOperator:
             project_id=TEST_GCP_PROJECT_ID,
         )
         mock_hook.return_value.generate_job_id.return_value = "1234"
-        mock_hook.return_value.get_client.return_value.get_job.side_effect = RuntimeError()
-        mock_hook.return_value.insert_job.side_effect = RuntimeError()
+        mock_hook.return_value.get_client.return_value.get_job.side_effect = RuntimeError
+        mock_hook.return_value.insert_job.side_effect = RuntimeError
 
         with suppress(RuntimeError):
-            operator.execute(MagicMock())
+            operator.execute(mock_context)
         lineage = operator.get_openlineage_facets_on_complete(None)
 
         assert isinstance(lineage.run_facets["errorMessage"], ErrorMessageRunFacet)
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_force_rerun_async(self, mock_hook, create_task_instance_of_operator):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-        mock_hook.return_value.generate_job_id.return_value = f"{job_id}_{hash_}"
+    def test_get_openlineage_facets_on_complete_after_failed_execute(self, make_insert_op):
+        op = make_insert_op(task_id="insert_query_job_failed")
+        # State left behind by an ``execute`` that failed after the job id was generated.
+        op.job_id = TEST_REAL_JOB_ID
+        op.hook = MagicMock()
+        op.hook.get_client.return_value.get_job.side_effect = RuntimeError
 
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            }
-        }
+        lineage = op.get_openlineage_facets_on_complete(None)
+
+        assert isinstance(lineage.run_facets["errorMessage"], ErrorMessageRunFacet)
+
+    def test_execute_force_rerun_async(self, mock_hook, mock_context, make_insert_op):
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
         mock_hook.return_value.insert_job.side_effect = Conflict("any")
-        job = MagicMock(
-            job_id=real_job_id,
+        job = SimpleNamespace(
+            job_id=TEST_REAL_JOB_ID,
             error_result=False,
             state="DONE",
             done=lambda: False,
         )
         mock_hook.return_value.get_job.return_value = job
 
-        ti = create_task_instance_of_operator(
-            BigQueryInsertJobOperator,
-            dag_id="dag_id",
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-            reattach_states={"PENDING"},
-            deferrable=True,
-        )
+        operator = make_insert_op(reattach_states={"PENDING"}, deferrable=True)
 
         with pytest.raises(AirflowException) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         expected_exception_msg = (
-            f"Job with id: {real_job_id} already exists and is in {job.state} state. "
+            f"Job with id: {TEST_REAL_JOB_ID} already exists and is in {job.state} state. "
             f"If you want to force rerun it consider setting `force_rerun=True`."
             f"Or, if you want to reattach in this scenario add {job.state} to `reattach_states`"
         )
@@ -1731,97 +1189,48 @@ class TestBigQueryInsertJobOperator:
 
         mock_hook.return_value.get_job.assert_called_once_with(
             location=TEST_DATASET_LOCATION,
-            job_id=real_job_id,
+            job_id=TEST_REAL_JOB_ID,
             project_id=TEST_GCP_PROJECT_ID,
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_adds_to_existing_labels(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-            "labels": {"foo": "bar"},
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+    def test_execute_adds_to_existing_labels(self, mock_hook, mock_context, make_insert_op):
+        configuration = copy.deepcopy(TEST_QUERY_CONFIGURATION)
+        configuration["labels"] = {"foo": "bar"}
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(TEST_REAL_JOB_ID)
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        op.execute(context=MagicMock())
+        op = make_insert_op(configuration=configuration)
+        op.execute(context=mock_context)
         assert configuration["labels"] == {
             "foo": "bar",
             "airflow-dag": "adhoc_airflow",
             "airflow-task": "insert_query_job",
         }
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_execute_respects_explicit_no_labels(self, mock_hook):
-        job_id = "123456"
-        hash_ = "hash"
-        real_job_id = f"{job_id}_{hash_}"
-
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-            "labels": None,
-        }
-        mock_hook.return_value.insert_job.return_value = MagicMock(
-            state="DONE", job_id=real_job_id, error_result=False
-        )
-        mock_hook.return_value.generate_job_id.return_value = real_job_id
+    def test_execute_respects_explicit_no_labels(self, mock_hook, mock_context, make_insert_op):
+        configuration = copy.deepcopy(TEST_QUERY_CONFIGURATION)
+        configuration["labels"] = None
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(TEST_REAL_JOB_ID)
+        mock_hook.return_value.generate_job_id.return_value = TEST_REAL_JOB_ID
 
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            job_id=job_id,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        op.execute(context=MagicMock())
+        op = make_insert_op(configuration=configuration)
+        op.execute(context=mock_context)
         assert configuration["labels"] is None
 
-    def test_task_label_too_big(self):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        op = BigQueryInsertJobOperator(
-            task_id="insert_query_job_except_this_task_id_is_really_really_really_really_long",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        op._add_job_labels()
-        assert "labels" not in configuration
-
-    @pytest.mark.db_test
-    def test_dag_label_too_big(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        with dag_maker("adhoc_airflow_except_this_task_id_is_really_really_really_really_long"):
+    @pytest.mark.parametrize(
+        "dag_id, task_id",
+        [
+            ("adhoc_airflow", "insert_query_job_except_this_task_id_is_really_really_really_really_long"),
+            ("adhoc_airflow", "task_id_with_exactly_64_characters_00000000000000000000000000000"),
+            ("adhoc_airflow_except_this_task_id_is_really_really_really_really_long", "insert_query_job"),
+        ],
+        ids=["task_label_too_big", "task_label_invalid_name", "dag_label_too_big"],
+    )
+    def test_labels_skipped_for_invalid_label(self, dag_id, task_id):
+        configuration = copy.deepcopy(TEST_QUERY_CONFIGURATION)
+        with DAG(dag_id, schedule=None):
             op = BigQueryInsertJobOperator(
-                task_id="insert_query_job",
+                task_id=task_id,
                 configuration=configuration,
                 location=TEST_DATASET_LOCATION,
                 project_id=TEST_GCP_PROJECT_ID,
@@ -1829,121 +1238,56 @@ class TestBigQueryInsertJobOperator:
         op._add_job_labels()
         assert "labels" not in configuration
 
-    @pytest.mark.db_test
-    def test_labels_lowercase(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        with dag_maker("YELLING_DAG_NAME"):
-            op = BigQueryInsertJobOperator(
-                task_id="YELLING_TASK_ID",
-                configuration=configuration,
-                location=TEST_DATASET_LOCATION,
-                project_id=TEST_GCP_PROJECT_ID,
-            )
-        op._add_job_labels()
-        assert configuration["labels"]["airflow-dag"] == "yelling_dag_name"
-        assert configuration["labels"]["airflow-task"] == "yelling_task_id"
-
-    @pytest.mark.db_test
-    def test_labels_starting_with_numbers(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        with dag_maker("123_dag"):
-            op = BigQueryInsertJobOperator(
-                task_id="123_task",
-                configuration=configuration,
-                location=TEST_DATASET_LOCATION,
-                project_id=TEST_GCP_PROJECT_ID,
-            )
-        op._add_job_labels()
-        assert configuration["labels"]["airflow-dag"] == "123_dag"
-        assert configuration["labels"]["airflow-task"] == "123_task"
-
-    @pytest.mark.db_test
-    def test_labels_starting_with_underscore(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        with dag_maker("_dag_starting_with_underscore"):
-            op = BigQueryInsertJobOperator(
-                task_id="_task_starting_with_underscore",
-                configuration=configuration,
-                location=TEST_DATASET_LOCATION,
-                project_id=TEST_GCP_PROJECT_ID,
-            )
-        op._add_job_labels()
-        assert "labels" in configuration
-        assert configuration["labels"]["airflow-dag"] == "_dag_starting_with_underscore"
-        assert configuration["labels"]["airflow-task"] == "_task_starting_with_underscore"
-
-    @pytest.mark.db_test
-    def test_labels_starting_with_hyphen(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        with dag_maker("-dag-starting-with-hyphen"):
+    @pytest.mark.parametrize(
+        "dag_id, task_id, expected_dag_label, expected_task_label",
+        [
+            ("YELLING_DAG_NAME", "YELLING_TASK_ID", "yelling_dag_name", "yelling_task_id"),
+            ("123_dag", "123_task", "123_dag", "123_task"),
+            (
+                "_dag_starting_with_underscore",
+                "_task_starting_with_underscore",
+                "_dag_starting_with_underscore",
+                "_task_starting_with_underscore",
+            ),
+            (
+                "-dag-starting-with-hyphen",
+                "-task-starting-with-hyphen",
+                "-dag-starting-with-hyphen",
+                "-task-starting-with-hyphen",
+            ),
+            (
+                "dag_replace_dots_with_hyphens",
+                "task.name.with.dots",
+                "dag_replace_dots_with_hyphens",
+                "task-name-with-dots",
+            ),
+        ],
+        ids=[
+            "lowercase",
+            "starting_with_numbers",
+            "starting_with_underscore",
+            "starting_with_hyphen",
+            "dots",
+        ],
+    )
+    def test_labels_normalized(self, dag_id, task_id, expected_dag_label, expected_task_label):
+        configuration = copy.deepcopy(TEST_QUERY_CONFIGURATION)
+        with DAG(dag_id, schedule=None):
             op = BigQueryInsertJobOperator(
-                task_id="-task-starting-with-hyphen",
+                task_id=task_id,
                 configuration=configuration,
                 location=TEST_DATASET_LOCATION,
                 project_id=TEST_GCP_PROJECT_ID,
             )
         op._add_job_labels()
-        assert "labels" in configuration
-        assert configuration["labels"]["airflow-dag"] == "-dag-starting-with-hyphen"
-        assert configuration["labels"]["airflow-task"] == "-task-starting-with-hyphen"
-
-    def test_labels_invalid_names(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        op = BigQueryInsertJobOperator(
-            task_id="task_id_with_exactly_64_characters_00000000000000000000000000000",
-            configuration=configuration,
-            location=TEST_DATASET_LOCATION,
-            project_id=TEST_GCP_PROJECT_ID,
-        )
-        op._add_job_labels()
-        assert "labels" not in configuration
-
-    @pytest.mark.db_test
-    def test_labels_replace_dots_with_hyphens(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
+        assert configuration["labels"] == {
+            "airflow-dag": expected_dag_label,
+            "airflow-task": expected_task_label,
         }
-        with dag_maker("dag_replace_dots_with_hyphens"):
-            op = BigQueryInsertJobOperator(
-                task_id="task.name.with.dots",
-                configuration=configuration,
-                location=TEST_DATASET_LOCATION,
-                project_id=TEST_GCP_PROJECT_ID,
-            )
-        op._add_job_labels()
-        assert "labels" in configuration
-        assert configuration["labels"]["airflow-dag"] == "dag_replace_dots_with_hyphens"
-        assert configuration["labels"]["airflow-task"] == "task-name-with-dots"
 
-        with dag_maker("dag_with_taskgroup"):
+    def test_labels_replace_task_group_dot_with_hyphen(self):
+        configuration = copy.deepcopy(TEST_QUERY_CONFIGURATION)
+        with DAG("dag_with_taskgroup", schedule=None):
             with TaskGroup("task_group"):
                 op = BigQueryInsertJobOperator(
                     task_id="task_name",
@@ -1956,51 +1300,39 @@ class TestBigQueryInsertJobOperator:
         assert configuration["labels"]["airflow-dag"] == "dag_with_taskgroup"
         assert configuration["labels"]["airflow-task"] == "task_group-task_name"
 
-    @pytest.mark.db_test
-    def test_labels_with_task_group_prefix_group_id(self, dag_maker):
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
-        with dag_maker("dag_with_taskgroup"):
+    @pytest.mark.parametrize(
+        "dag_id, task_id, expected_task_label",
+        [
+            ("dag_with_taskgroup", "task_name", "task_name"),
+            (
+                "dag_with_taskgroup_prefix_group_id_false_with_dots",
+                "task.name.with.dots",
+                "task-name-with-dots",
+            ),
+        ],
+        ids=["plain", "dots"],
+    )
+    def test_labels_with_task_group_prefix_group_id(self, dag_id, task_id, expected_task_label):
+        configuration = copy.deepcopy(TEST_QUERY_CONFIGURATION)
+        with DAG(dag_id, schedule=None):
             with TaskGroup("task_group", prefix_group_id=False):
                 op = BigQueryInsertJobOperator(
-                    task_id="task_name",
-                    configuration=configuration,
-                    location=TEST_DATASET_LOCATION,
-                    project_id=TEST_GCP_PROJECT_ID,
-                )
-        op._add_job_labels()
-        assert "labels" in configuration
-        assert configuration["labels"]["airflow-dag"] == "dag_with_taskgroup"
-        assert configuration["labels"]["airflow-task"] == "task_name"
-
-        with dag_maker("dag_with_taskgroup_prefix_group_id_false_with_dots"):
-            with TaskGroup("task_group_prefix_group_id_false", prefix_group_id=False):
-                op = BigQueryInsertJobOperator(
-                    task_id="task.name.with.dots",
+                    task_id=task_id,
                     configuration=configuration,
                     location=TEST_DATASET_LOCATION,
                     project_id=TEST_GCP_PROJECT_ID,
                 )
         op._add_job_labels()
-        assert "labels" in configuration
-        assert configuration["labels"]["airflow-dag"] == "dag_with_taskgroup_prefix_group_id_false_with_dots"
-        assert configuration["labels"]["airflow-task"] == "task-name-with-dots"
+        assert configuration["labels"] == {
+            "airflow-dag": dag_id,
+            "airflow-task": expected_task_label,
+        }
 
     def test_handle_job_error_raises_on_error_result_or_error(self, caplog):
         caplog.set_level(logging.ERROR)
-        configuration = {
-            "query": {
-                "query": "SELECT * FROM any",
-                "useLegacySql": False,
-            },
-        }
         op = BigQueryInsertJobOperator(
             task_id="task.with.dots.is.allowed",
-            configuration=configuration,
+            configuration=copy.deepcopy(TEST_QUERY_CONFIGURATION),
             location=TEST_DATASET_LOCATION,
             project_id=TEST_GCP_PROJECT_ID,
             job_id="12345",
@@ -2069,9 +1401,7 @@ class TestBigQueryIntervalCheckOperator:
 
         assert operator.project_id == TEST_JOB_PROJECT_ID
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_interval_check_operator_async(self, mock_hook, create_task_instance_of_operator):
+    def test_bigquery_interval_check_operator_async(self, mock_hook, mock_context):
         """
         Asserts that a task is deferred and a BigQueryIntervalCheckTrigger will be fired
         when the BigQueryIntervalCheckOperator is executed with deferrable=True.
@@ -2080,11 +1410,9 @@ class TestBigQueryIntervalCheckOperator:
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
 
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=False)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, state="RUNNING")
 
-        ti = create_task_instance_of_operator(
-            BigQueryIntervalCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryIntervalCheckOperator(
             task_id="bq_interval_check_operator_execute_complete",
             table="test_table",
             metrics_thresholds={"COUNT(*)": 1.5},
@@ -2093,17 +1421,13 @@ class TestBigQueryIntervalCheckOperator:
         )
 
         with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert isinstance(exc.value.trigger, BigQueryIntervalCheckTrigger), (
             "Trigger is not a BigQueryIntervalCheckTrigger"
         )
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_interval_check_operator_with_project_id(
-        self, mock_hook, create_task_instance_of_operator
-    ):
+    def test_bigquery_interval_check_operator_with_project_id(self, mock_hook, mock_context):
         """
         Test BigQueryIntervalCheckOperator with a specified project_id.
         Ensure that the bq_project_id is passed correctly when submitting the job.
@@ -2113,9 +1437,7 @@ class TestBigQueryIntervalCheckOperator:
         real_job_id = f"{job_id}_{hash_}"
 
         project_id = "test-project-id"
-        ti = create_task_instance_of_operator(
-            BigQueryIntervalCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryIntervalCheckOperator(
             task_id="bq_interval_check_operator_with_project_id",
             table="test_table",
             metrics_thresholds={"COUNT(*)": 1.5},
@@ -2124,10 +1446,10 @@ class TestBigQueryIntervalCheckOperator:
             project_id=project_id,
         )
 
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=False)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, state="RUNNING")
 
         with pytest.raises(TaskDeferred):
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         mock_hook.return_value.insert_job.assert_called_with(
             configuration=mock.ANY,
@@ -2137,11 +1459,7 @@ class TestBigQueryIntervalCheckOperator:
             nowait=True,
         )
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_interval_check_operator_without_project_id(
-        self, mock_hook, create_task_instance_of_operator
-    ):
+    def test_bigquery_interval_check_operator_without_project_id(self, mock_hook, mock_context):
         """
         Test BigQueryIntervalCheckOperator without a specified project_id.
         Ensure that the project_id falls back to the hook.project_id as previously implemented.
@@ -2151,9 +1469,7 @@ class TestBigQueryIntervalCheckOperator:
         real_job_id = f"{job_id}_{hash_}"
 
         project_id = "test-project-id"
-        ti = create_task_instance_of_operator(
-            BigQueryIntervalCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryIntervalCheckOperator(
             task_id="bq_interval_check_operator_without_project_id",
             table="test_table",
             metrics_thresholds={"COUNT(*)": 1.5},
@@ -2162,10 +1478,10 @@ class TestBigQueryIntervalCheckOperator:
         )
 
         mock_hook.return_value.project_id = project_id
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=False)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, state="RUNNING")
 
         with pytest.raises(TaskDeferred):
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         mock_hook.return_value.insert_job.assert_called_with(
             configuration=mock.ANY,
@@ -2175,9 +1491,7 @@ class TestBigQueryIntervalCheckOperator:
             nowait=True,
         )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
-    def test_encryption_configuration_deferrable_mode(self, mock_job, mock_hook):
+    def test_encryption_configuration_deferrable_mode(self, mock_job, mock_hook, mock_context):
         encryption_configuration = {
             "kmsKeyName": "projects/PROJECT/locations/LOCATION/keyRings/KEY_RING/cryptoKeys/KEY",
         }
@@ -2194,7 +1508,7 @@ class TestBigQueryIntervalCheckOperator:
             deferrable=True,
         )
         with pytest.raises(TaskDeferred):
-            operator.execute(MagicMock())
+            operator.execute(mock_context)
         mock_hook.return_value.insert_job.assert_called_with(
             configuration={
                 "query": {
@@ -2211,54 +1525,45 @@ class TestBigQueryIntervalCheckOperator:
 
 
 class TestBigQueryCheckOperator:
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryCheckOperator._validate_records")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryCheckOperator.defer")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_check_operator_async_finish_before_deferred(
-        self, mock_hook, mock_defer, mock_validate_records, create_task_instance_of_operator
-    ):
+    def test_bigquery_check_operator_async_finish_before_deferred(self, mock_hook, mock_context):
         job_id = "123456"
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
 
-        mocked_job = MagicMock(job_id=real_job_id, error_result=False)
+        mocked_job = create_bigquery_job(real_job_id)
         mocked_job.result.return_value = iter([(1, 2, 3)])  # mock rows generator
         mock_hook.return_value.insert_job.return_value = mocked_job
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        ti = create_task_instance_of_operator(
-            BigQueryCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryCheckOperator(
             task_id="bq_check_operator_job",
             sql="SELECT * FROM any",
             location=TEST_DATASET_LOCATION,
             deferrable=True,
         )
 
-        ti.task.execute(MagicMock())
-        mock_defer.assert_not_called()
-        mock_validate_records.assert_called_once_with((1, 2, 3))
+        with mock.patch.multiple(
+            BigQueryCheckOperator, _validate_records=mock.DEFAULT, defer=mock.DEFAULT
+        ) as mocks:
+            operator.execute(mock_context)
+        mocks["defer"].assert_not_called()
+        mocks["_validate_records"].assert_called_once_with((1, 2, 3))
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryCheckOperator._validate_records")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
+    @mock.patch.object(BigQueryCheckOperator, "_validate_records")
     def test_bigquery_check_operator_query_parameters_passing(
-        self, mock_hook, mock_validate_records, create_task_instance_of_operator
+        self, mock_validate_records, mock_hook, mock_context
     ):
         job_id = "123456"
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
         query_params = [ScalarQueryParameter("test_param", "INT64", 1)]
 
-        mocked_job = MagicMock(job_id=real_job_id, error_result=False)
+        mocked_job = create_bigquery_job(real_job_id)
         mocked_job.result.return_value = iter([(1, 2, 3)])  # mock rows generator
         mock_hook.return_value.insert_job.return_value = mocked_job
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        ti = create_task_instance_of_operator(
-            BigQueryCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryCheckOperator(
             task_id="bq_check_operator_query_params_job",
             sql="SELECT * FROM any WHERE test_param = @test_param",
             location=TEST_DATASET_LOCATION,
@@ -2266,24 +1571,18 @@ class TestBigQueryCheckOperator:
             query_params=query_params,
         )
 
-        ti.task.execute(MagicMock())
+        operator.execute(mock_context)
         mock_validate_records.assert_called_once_with((1, 2, 3))
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_check_operator_async_finish_with_error_before_deferred(
-        self, mock_hook, create_task_instance_of_operator
-    ):
+    def test_bigquery_check_operator_async_finish_with_error_before_deferred(self, mock_hook, mock_context):
         job_id = "123456"
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
 
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=True)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, error_result=True)
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        ti = create_task_instance_of_operator(
-            BigQueryCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryCheckOperator(
             task_id="bq_check_operator_job",
             sql="SELECT * FROM any",
             location=TEST_DATASET_LOCATION,
@@ -2291,13 +1590,11 @@ class TestBigQueryCheckOperator:
         )
 
         with pytest.raises(AirflowException) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert str(exc.value) == f"BigQuery job {real_job_id} failed: True"
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_check_operator_async(self, mock_hook, create_task_instance_of_operator):
+    def test_bigquery_check_operator_async(self, mock_hook, mock_context):
         """
         Asserts that a task is deferred and a BigQueryCheckTrigger will be fired
         when the BigQueryCheckOperator is executed with deferrable=True.
@@ -2306,11 +1603,9 @@ class TestBigQueryCheckOperator:
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
 
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=False)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, state="RUNNING")
 
-        ti = create_task_instance_of_operator(
-            BigQueryCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryCheckOperator(
             task_id="bq_check_operator_job",
             sql="SELECT * FROM any",
             location=TEST_DATASET_LOCATION,
@@ -2318,25 +1613,10 @@ class TestBigQueryCheckOperator:
         )
 
         with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert isinstance(exc.value.trigger, BigQueryCheckTrigger), "Trigger is not a BigQueryCheckTrigger"
 
-    def test_bigquery_check_operator_execute_failure(self):
-        """Tests that an AirflowException is raised in case of error event"""
-
-        operator = BigQueryCheckOperator(
-            task_id="bq_check_operator_execute_failure",
-            sql="SELECT * FROM any",
-            location=TEST_DATASET_LOCATION,
-            deferrable=True,
-        )
-
-        with pytest.raises(AirflowException):
-            operator.execute_complete(
-                context=None, event={"status": "error", "message": "test failure message"}
-            )
-
     def test_bigquery_check_operator_project_id(self):
         operator = BigQueryCheckOperator(
             task_id="bq_check_operator_project_id",
@@ -2347,64 +1627,51 @@ class TestBigQueryCheckOperator:
 
         assert operator.project_id == TEST_JOB_PROJECT_ID
 
-    def test_bigquery_check_op_execute_complete_with_no_records(self):
-        """Asserts that exception is raised with correct expected exception message"""
-
-        operator = BigQueryCheckOperator(
+    @pytest.fixture(scope="class")
+    def deferrable_operator(self):
+        return BigQueryCheckOperator(
             task_id="bq_check_operator_execute_complete",
             sql="SELECT * FROM any",
             location=TEST_DATASET_LOCATION,
             deferrable=True,
         )
 
-        with pytest.raises(AirflowException, match="The following query returned zero rows:"):
-            operator.execute_complete(context=None, event={"status": "success", "records": None})
-
-    def test_bigquery_check_op_execute_complete_with_non_boolean_records(self):
-        """Executing a sql which returns a non-boolean value should raise exception"""
-
-        test_sql = "SELECT * FROM any"
-
-        operator = BigQueryCheckOperator(
-            task_id="bq_check_operator_execute_complete",
-            sql=test_sql,
-            location=TEST_DATASET_LOCATION,
-            deferrable=True,
-        )
-
-        expected_exception_msg = f"Test failed.\nQuery:\n{test_sql}\nResults:\n{[20, False]!s}"
-
+    @pytest.mark.parametrize(
+        "event, expected_message",
+        [
+            ({"status": "error", "message": "test failure message"}, "test failure message"),
+            (
+                {"status": "success", "records": None},
+                "The following query returned zero rows: SELECT * FROM any",
+            ),
+            (
+                {"status": "success", "records": [20, False]},
+                f"Test failed.\nQuery:\nSELECT * FROM any\nResults:\n{[20, False]!s}",
+            ),
+        ],
+        ids=["error_event", "no_records", "non_boolean_records"],
+    )
+    def test_bigquery_check_op_execute_complete_failure(self, deferrable_operator, event, expected_message):
+        """Asserts that an AirflowException is raised with the expected message"""
         with pytest.raises(AirflowException) as exc:
-            operator.execute_complete(context=None, event={"status": "success", "records": [20, False]})
+            deferrable_operator.execute_complete(context=None, event=event)
 
-        assert str(exc.value) == expected_exception_msg
+        assert str(exc.value) == expected_message
 
-    def test_bigquery_check_operator_execute_complete(self):
+    def test_bigquery_check_operator_execute_complete(self, deferrable_operator):
         """Asserts that logging occurs as expected"""
-
-        operator = BigQueryCheckOperator(
-            task_id="bq_check_operator_execute_complete",
-            sql="SELECT * FROM any",
-            location=TEST_DATASET_LOCATION,
-            deferrable=True,
-        )
-
-        with mock.patch.object(operator.log, "info") as mock_log_info:
-            operator.execute_complete(context=None, event={"status": "success", "records": [20]})
+        with mock.patch.object(deferrable_operator.log, "info") as mock_log_info:
+            deferrable_operator.execute_complete(context=None, event={"status": "success", "records": [20]})
         mock_log_info.assert_called_with("Success.")
 
 
 class TestBigQueryValueCheckOperator:
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_value_check_async(self, mock_hook, create_task_instance_of_operator):
+    def test_bigquery_value_check_async(self, mock_hook, mock_context):
         """
         Asserts that a task is deferred and a BigQueryValueCheckTrigger will be fired
         when the BigQueryValueCheckOperator with deferrable=True is executed.
         """
-        ti = create_task_instance_of_operator(
-            BigQueryValueCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryValueCheckOperator(
             task_id="check_value",
             sql="SELECT COUNT(*) FROM Any",
             pass_value=2,
@@ -2414,33 +1681,25 @@ class TestBigQueryValueCheckOperator:
         job_id = "123456"
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=False)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, state="RUNNING")
         with pytest.raises(TaskDeferred) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert isinstance(exc.value.trigger, BigQueryValueCheckTrigger), (
             "Trigger is not a BigQueryValueCheckTrigger"
         )
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryValueCheckOperator.defer")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryValueCheckOperator.check_value")
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    def test_bigquery_value_check_operator_async_finish_before_deferred(
-        self, mock_hook, mock_check_value, mock_defer, create_task_instance_of_operator
-    ):
+    def test_bigquery_value_check_operator_async_finish_before_deferred(self, mock_hook, mock_context):
         job_id = "123456"
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
 
-        mocked_job = MagicMock(job_id=real_job_id, error_result=False)
+        mocked_job = create_bigquery_job(real_job_id)
         mocked_job.result.return_value = iter([(1, 2, 3)])  # mock rows generator
         mock_hook.return_value.insert_job.return_value = mocked_job
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        ti = create_task_instance_of_operator(
-            BigQueryValueCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryValueCheckOperator(
             task_id="check_value",
             sql="SELECT COUNT(*) FROM Any",
             pass_value=2,
@@ -2448,25 +1707,24 @@ class TestBigQueryValueCheckOperator:
             deferrable=True,
         )
 
-        ti.task.execute(MagicMock())
-        assert not mock_defer.called
-        mock_check_value.assert_called_once_with((1, 2, 3))
+        with mock.patch.multiple(
+            BigQueryValueCheckOperator, check_value=mock.DEFAULT, defer=mock.DEFAULT
+        ) as mocks:
+            operator.execute(mock_context)
+        assert not mocks["defer"].called
+        mocks["check_value"].assert_called_once_with((1, 2, 3))
 
-    @pytest.mark.db_test
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
     def test_bigquery_value_check_operator_async_finish_with_error_before_deferred(
-        self, mock_hook, create_task_instance_of_operator
+        self, mock_hook, mock_context
     ):
         job_id = "123456"
         hash_ = "hash"
         real_job_id = f"{job_id}_{hash_}"
 
-        mock_hook.return_value.insert_job.return_value = MagicMock(job_id=real_job_id, error_result=True)
+        mock_hook.return_value.insert_job.return_value = create_bigquery_job(real_job_id, error_result=True)
         mock_hook.return_value.insert_job.return_value.running.return_value = False
 
-        ti = create_task_instance_of_operator(
-            BigQueryValueCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryValueCheckOperator(
             task_id="check_value",
             sql="SELECT COUNT(*) FROM Any",
             pass_value=2,
@@ -2475,7 +1733,7 @@ class TestBigQueryValueCheckOperator:
         )
 
         with pytest.raises(AirflowException) as exc:
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
         assert str(exc.value) == f"BigQuery job {real_job_id} failed: True"
 
@@ -2547,9 +1805,7 @@ class TestBigQueryValueCheckOperator:
                 context=None, event={"status": "error", "message": "test failure message"}
             )
 
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery.BigQueryHook")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
-    def test_encryption_configuration_deferrable_mode(self, mock_job, mock_hook):
+    def test_encryption_configuration_deferrable_mode(self, mock_job, mock_hook, mock_context):
         encryption_configuration = {
             "kmsKeyName": "projects/PROJECT/locations/LOCATION/keyRings/KEY_RING/cryptoKeys/KEY",
         }
@@ -2572,7 +1828,7 @@ class TestBigQueryValueCheckOperator:
             deferrable=True,
         )
         with pytest.raises(TaskDeferred):
-            operator.execute(MagicMock())
+            operator.execute(mock_context)
         mock_hook.return_value.insert_job.assert_called_with(
             configuration={
                 "query": {
@@ -2588,7 +1844,6 @@ class TestBigQueryValueCheckOperator:
         )
 
 
-@pytest.mark.db_test
 class TestBigQueryColumnCheckOperator:
     @pytest.mark.parametrize(
         "check_type, check_value, check_result",
@@ -2602,19 +1857,22 @@ class TestBigQueryColumnCheckOperator:
             ("leq_to", 0, -1),
         ],
     )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery._BigQueryHookWithFlexibleProjectId")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
+    @mock.patch.object(bigquery_operators, "_BigQueryHookWithFlexibleProjectId")
     def test_bigquery_column_check_operator_succeeds(
-        self, mock_job, mock_hook, check_type, check_value, check_result, create_task_instance_of_operator
+        self,
+        mock_hook,
+        mock_job,
+        check_type,
+        check_value,
+        check_result,
+        mock_context,
     ):
         mock_job.result.return_value.to_dataframe.return_value = pd.DataFrame(
             {"col_name": ["col1"], "check_type": ["min"], "check_result": [check_result]}
         )
         mock_hook.return_value.insert_job.return_value = mock_job
 
-        ti = create_task_instance_of_operator(
-            BigQueryColumnCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryColumnCheckOperator(
             task_id="check_column_succeeds",
             table=TEST_TABLE_ID,
             use_legacy_sql=False,
@@ -2622,7 +1880,7 @@ class TestBigQueryColumnCheckOperator:
                 "col1": {"min": {check_type: check_value}},
             },
         )
-        ti.task.execute(MagicMock())
+        operator.execute(mock_context)
 
     @pytest.mark.parametrize(
         "check_type, check_value, check_result",
@@ -2634,19 +1892,22 @@ class TestBigQueryColumnCheckOperator:
             ("leq_to", 0, 1),
         ],
     )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery._BigQueryHookWithFlexibleProjectId")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
+    @mock.patch.object(bigquery_operators, "_BigQueryHookWithFlexibleProjectId")
     def test_bigquery_column_check_operator_fails(
-        self, mock_job, mock_hook, check_type, check_value, check_result, create_task_instance_of_operator
+        self,
+        mock_hook,
+        mock_job,
+        check_type,
+        check_value,
+        check_result,
+        mock_context,
     ):
         mock_job.result.return_value.to_dataframe.return_value = pd.DataFrame(
             {"col_name": ["col1"], "check_type": ["min"], "check_result": [check_result]}
         )
         mock_hook.return_value.insert_job.return_value = mock_job
 
-        ti = create_task_instance_of_operator(
-            BigQueryColumnCheckOperator,
-            dag_id="dag_id",
+        operator = BigQueryColumnCheckOperator(
             task_id="check_column_fails",
             table=TEST_TABLE_ID,
             use_legacy_sql=False,
@@ -2655,7 +1916,7 @@ class TestBigQueryColumnCheckOperator:
             },
         )
         with pytest.raises(AirflowException):
-            ti.task.execute(MagicMock())
+            operator.execute(mock_context)
 
     @pytest.mark.parametrize(
         "check_type, check_value, check_result",
@@ -2665,9 +1926,10 @@ class TestBigQueryColumnCheckOperator:
             ("less_than", 0, -1),
         ],
     )
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery._BigQueryHookWithFlexibleProjectId")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
-    def test_encryption_configuration(self, mock_job, mock_hook, check_type, check_value, check_result):
+    @mock.patch.object(bigquery_operators, "_BigQueryHookWithFlexibleProjectId")
+    def test_encryption_configuration(
+        self, mock_hook, mock_job, check_type, check_value, check_result, mock_context
+    ):
         encryption_configuration = {
             "kmsKeyName": "projects/PROJECT/locations/LOCATION/keyRings/KEY_RING/cryptoKeys/KEY",
         }
@@ -2686,7 +1948,7 @@ class TestBigQueryColumnCheckOperator:
             location=TEST_DATASET_LOCATION,
         )
 
-        operator.execute(MagicMock())
+        operator.execute(mock_context)
         mock_hook.return_value.insert_job.assert_called_with(
             configuration={
                 "query": {
@@ -2706,9 +1968,8 @@ class TestBigQueryColumnCheckOperator:
 
 
 class TestBigQueryTableCheckOperator:
-    @mock.patch("airflow.providers.google.cloud.operators.bigquery._BigQueryHookWithFlexibleProjectId")
-    @mock.patch("airflow.providers.google.cloud.hooks.bigquery.BigQueryJob")
-    def test_encryption_configuration(self, mock_job, mock_hook):
+    @mock.patch.object(bigquery_operators, "_BigQueryHookWithFlexibleProjectId")
+    def test_encryption_configuration(self, mock_hook, mock_job, mock_context):
         encryption_configuration = {
             "kmsKeyName": "projects/PROJECT/locations/LOCATION/keyRings/KEY_RING/cryptoKeys/KEY",
         }
@@ -2731,7 +1992,7 @@ class TestBigQueryTableCheckOperator:
             location=TEST_DATASET_LOCATION,
         )
 
-        operator.execute(MagicMock())
+        operator.execute(mock_context)
         mock_hook.return_value.insert_job.assert_called_with(
             configuration={
                 "query": {